@@ -3,8 +3,10 @@ Command-line interface for Nexobot scraper.
 """
 
 import argparse
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from .http import HostRateLimiter
+from .log import logger, setup_logging
 from .scraper import Scraper
 from .storage import ArticleStorage
 from .config import ScraperConfig, HistoryManager
@@ -33,6 +35,8 @@ Examples:
                         help='Maximum articles to scrape (default: all)')
     parser.add_argument('--delay', '-d', type=float, default=1.0,
                         help='Delay between requests in seconds (default: 1.0)')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Maximum URLs processed in parallel in config mode (default: 8)')
     parser.add_argument('--output', '-o', default='output',
                         help='Output directory (default: output)')
     parser.add_argument('--min-depth', type=int, default=3,
@@ -41,7 +45,9 @@ Examples:
                         help='Skip URL validation')
     
     args = parser.parse_args()
-    
+
+    setup_logging()
+
     # Initialize scraper and storage
     scraper = Scraper(min_path_depth=args.min_depth)
     storage = ArticleStorage(args.output)
@@ -68,8 +74,8 @@ def _run_config_mode(args, scraper: Scraper, storage: ArticleStorage):
     if config.worker_mode:
         from .worker import WorkerManager
         
-        print("[INFO] Starting worker mode (daemon)")
-        print(f"[INFO] Cycle delay: {config.cycle_delay}s")
+        logger.info("[INFO] Starting worker mode (daemon)")
+        logger.info(f"[INFO] Cycle delay: {config.cycle_delay}s")
         
         manager = WorkerManager(config, output_dir=args.output)
         manager.start(
@@ -87,16 +93,26 @@ def _run_config_mode(args, scraper: Scraper, storage: ArticleStorage):
     storage = ArticleStorage(args.output, airtable_config=config.airtable)
     output_format = config.output_format
     
-    print(f"[INFO] Loaded config with {len(config.urls)} URLs")
-    print(f"[INFO] Output format: {output_format}")
-    
+    logger.info(f"[INFO] Loaded config with {len(config.urls)} URLs")
+    logger.info(f"[INFO] Output format: {output_format}")
+
+    pending = []
     for url in config.urls:
         if history and history.is_scraped(url):
-            print(f"[SKIP] Already scraped: {url}")
+            logger.info(f"[SKIP] Already scraped: {url}")
             continue
-        
+        pending.append(url)
+
+    if not pending:
+        return
+
+    # Per-host politeness: concurrent workers must still space out requests
+    # that target the same host.
+    limiter = HostRateLimiter(args.delay)
+
+    def _process_url(url: str):
         if scraper.url_validator.is_root_domain(url):
-            print(f"\n[INFO] Root domain: {url}")
+            logger.info(f"\n[INFO] Root domain: {url}")
             sitemap_url = discover_sitemap(url)
             if sitemap_url:
                 articles = scraper.scrape_from_sitemap(
@@ -107,19 +123,39 @@ def _run_config_mode(args, scraper: Scraper, storage: ArticleStorage):
                 for article in articles:
                     if history and history.is_scraped(article.url):
                         continue
+                    if history and history.is_duplicate_content(article.content_html):
+                        logger.info(f"[SKIP] Duplicate content: {article.url}")
+                        history.mark_scraped(article.url)
+                        continue
                     storage.save(article, output_format=output_format)
                     if history:
+                        history.mark_content(article.content_html)
                         history.mark_scraped(article.url)
             else:
-                print(f"[FAILED] No sitemap found for {url}")
+                logger.error(f"[FAILED] No sitemap found for {url}")
         else:
+            limiter.wait(url)
             article = scraper.scrape(url, validate_url=not args.skip_validation)
             if article:
+                if history and history.is_duplicate_content(article.content_html):
+                    logger.info(f"[SKIP] Duplicate content: {url}")
+                    history.mark_scraped(url)
+                    return
                 storage.save(article, output_format=output_format)
                 if history:
+                    history.mark_content(article.content_html)
                     history.mark_scraped(url)
-        
-        time.sleep(args.delay)
+
+    max_workers = max(1, min(args.concurrency, len(pending)))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_process_url, url): url for url in pending}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"[ERROR] Failed processing {futures[future]}: {e}")
+
+    storage.flush()
 
 
 def _run_sitemap_mode(args, scraper: Scraper, storage: ArticleStorage):
@@ -138,12 +174,12 @@ def _run_single_mode(args, scraper: Scraper, storage: ArticleStorage):
     url = args.url or "https://cetta.id/updates/bahasa-jepang/kata-karena/"
     
     if scraper.url_validator.is_root_domain(url):
-        print(f"[INFO] Root domain detected: {url}")
-        print(f"[INFO] Auto-discovering sitemap...")
+        logger.info(f"[INFO] Root domain detected: {url}")
+        logger.info(f"[INFO] Auto-discovering sitemap...")
         
         sitemap_url = discover_sitemap(url)
         if sitemap_url:
-            print(f"[INFO] Found sitemap, switching to sitemap mode")
+            logger.info(f"[INFO] Found sitemap, switching to sitemap mode")
             articles = scraper.scrape_from_sitemap(
                 sitemap_url=sitemap_url,
                 max_articles=args.max,
@@ -152,17 +188,18 @@ def _run_single_mode(args, scraper: Scraper, storage: ArticleStorage):
             for article in articles:
                 storage.save(article)
         else:
-            print(f"[FAILED] Could not find sitemap for {url}")
+            logger.error(f"[FAILED] Could not find sitemap for {url}")
     else:
         article = scraper.scrape(url, validate_url=not args.skip_validation)
         if article:
             storage.save(article)
+            # The scraped JSON is program output, not a log line
             print("\n" + "=" * 60)
             print("SCRAPED CONTENT (JSON)")
             print("=" * 60)
             print(article.to_json())
         else:
-            print("[FAILED] Could not scrape the article")
+            logger.error("[FAILED] Could not scrape the article")
 
 
 if __name__ == "__main__":
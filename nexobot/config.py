@@ -2,12 +2,18 @@
 Configuration and state management.
 """
 
-import json
+import atexit
+import hashlib
 import os
+import re
+import threading
 from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 
+from . import jsonutil
+from .log import logger
+
 
 @dataclass
 class AirtableConfig:
@@ -37,13 +43,13 @@ class ScraperConfig:
     def load(cls, path: str = "config.json") -> "ScraperConfig":
         """Load configuration from JSON file."""
         if not os.path.exists(path):
-            print(f"[INFO] No config file found at {path}, using defaults")
+            logger.info(f"[INFO] No config file found at {path}, using defaults")
             return cls()
         
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+                data = jsonutil.loads(f.read())
+
             # Load Airtable config if present
             airtable_config = None
             if 'airtable' in data:
@@ -63,8 +69,8 @@ class ScraperConfig:
                 urls=data.get('urls', []),
                 airtable=airtable_config
             )
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"[ERROR] Failed to load config: {e}")
+        except (ValueError, IOError) as e:
+            logger.error(f"[ERROR] Failed to load config: {e}")
             return cls()
     
     def save(self, path: str = "config.json"):
@@ -84,64 +90,150 @@ class ScraperConfig:
             }
         
         with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        print(f"[INFO] Config saved to {path}")
+            f.write(jsonutil.dumps(data, indent=2))
+        logger.info(f"[INFO] Config saved to {path}")
 
 
 class HistoryManager:
-    """Manages scraped URL history to prevent duplicate scraping."""
-    
+    """
+    Manages scraped URL history to prevent duplicate scraping.
+
+    The in-memory set is authoritative. New URLs are appended to an
+    ndjson-style log (one URL per line), so marking a URL is O(1)
+    instead of rewriting the whole history file. The log is compacted
+    from the set on exit. The legacy JSON file is still read on
+    startup as an import path.
+    """
+
     def __init__(self, history_file: str = "scraped_history.json"):
         self.history_file = history_file
+        self.log_file = os.path.splitext(history_file)[0] + '.ndjson'
         self.scraped_urls: set = set()
+        # Digests of article content seen this run, for catching the
+        # same content served at multiple URLs (canonical variants,
+        # trailing slashes, tracking parameters).
+        self.content_digests: set = set()
+        self._lock = threading.Lock()
         self._load_history()
-    
+        self._log = open(self.log_file, 'a', encoding='utf-8', buffering=1)
+        atexit.register(self.compact)
+
+    def _fix_directory(self, path: str) -> bool:
+        """Fix for Docker mounting a directory instead of a file."""
+        if not os.path.isdir(path):
+            return True
+        try:
+            import shutil
+            logger.warning(f"[WARNING] History file {path} is a directory. Removing and recreating as file.")
+            shutil.rmtree(path)
+            return True
+        except OSError as e:
+            logger.error(f"[ERROR] Could not fix history directory: {e}")
+            return False
+
     def _load_history(self):
-        """Load scraped URL history from file."""
-        if not os.path.exists(self.history_file):
+        """Load scraped URL history from the log and legacy JSON file."""
+        if not (self._fix_directory(self.history_file) and self._fix_directory(self.log_file)):
             return
-            
-        # Fix for Docker mounting directory instead of file
-        if os.path.isdir(self.history_file):
+
+        # Legacy import: histories written before the append-only log
+        if os.path.exists(self.history_file):
             try:
-                import shutil
-                print(f"[WARNING] History file is a directory. Removing and recreating as file.")
-                shutil.rmtree(self.history_file)
-                # Save empty history immediately to create the file
-                self._save_history()
-                return
-            except OSError as e:
-                print(f"[ERROR] Could not fix history directory: {e}")
+                with open(self.history_file, 'r', encoding='utf-8') as f:
+                    data = jsonutil.loads(f.read())
+                    self.scraped_urls.update(data.get('urls', []))
+            except (ValueError, IOError) as e:
+                logger.warning(f"[WARNING] Could not load history: {e}")
+
+        if os.path.exists(self.log_file):
+            try:
+                with open(self.log_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        url = line.strip()
+                        if url:
+                            self.scraped_urls.add(url)
+            except IOError as e:
+                logger.warning(f"[WARNING] Could not load history log: {e}")
+
+        if self.scraped_urls:
+            logger.info(f"[INFO] Loaded {len(self.scraped_urls)} URLs from history")
+
+    def compact(self):
+        """Rewrite the log from the in-memory set, dropping duplicates."""
+        with self._lock:
+            if self._log.closed:
                 return
-        
-        try:
-            with open(self.history_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.scraped_urls = set(data.get('urls', []))
-            print(f"[INFO] Loaded {len(self.scraped_urls)} URLs from history")
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"[WARNING] Could not load history: {e}")
-    
-    def _save_history(self):
-        """Save scraped URL history to file."""
+            tmp_file = self.log_file + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.writelines(url + '\n' for url in self.scraped_urls)
+            self._log.close()
+            os.replace(tmp_file, self.log_file)
+            self._log = open(self.log_file, 'a', encoding='utf-8', buffering=1)
+            self._write_legacy()
+
+    def _write_legacy(self):
+        """
+        Mirror the in-memory set into the legacy JSON file.
+
+        The shipped docker-compose bind-mounts scraped_history.json
+        alone, so that file has to stay durable across container
+        recreations. Written in place (no rename, no delete) because
+        replacing a single-file bind mount detaches it from its inode
+        and the host stops seeing updates. Call with the lock held.
+        """
         data = {
             'urls': list(self.scraped_urls),
             'last_updated': datetime.now().isoformat()
         }
-        with open(self.history_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-    
+        try:
+            with open(self.history_file, 'w', encoding='utf-8') as f:
+                f.write(jsonutil.dumps(data, indent=2))
+        except IOError as e:
+            logger.warning(f"[WARNING] Could not write history file: {e}")
+
+    def checkpoint(self):
+        """
+        Compact the history log at a natural boundary (e.g. between
+        worker cycles) so it stays deduplicated on long daemon runs.
+        """
+        self.compact()
+
+    _WHITESPACE_RE = re.compile(r'\s+')
+
+    @classmethod
+    def content_digest(cls, text: str) -> bytes:
+        """SHA1 digest of whitespace-normalized content text."""
+        return hashlib.sha1(cls._WHITESPACE_RE.sub(' ', text).encode('utf-8')).digest()
+
+    def is_duplicate_content(self, text: str) -> bool:
+        """Check if identical content was already seen this run."""
+        return self.content_digest(text) in self.content_digests
+
+    def mark_content(self, text: str):
+        """Record content so later identical articles are detected."""
+        with self._lock:
+            self.content_digests.add(self.content_digest(text))
+
     def is_scraped(self, url: str) -> bool:
         """Check if a URL has already been scraped."""
         return url in self.scraped_urls
-    
+
     def mark_scraped(self, url: str):
-        """Mark a URL as scraped and save to history."""
-        self.scraped_urls.add(url)
-        self._save_history()
-    
+        """Mark a URL as scraped and append it to the history log."""
+        with self._lock:
+            if url in self.scraped_urls:
+                return
+            self.scraped_urls.add(url)
+            self._log.write(url + '\n')
+
     def clear_history(self):
         """Clear all scraped URL history."""
-        self.scraped_urls.clear()
-        self._save_history()
-        print("[INFO] History cleared")
+        with self._lock:
+            self.scraped_urls.clear()
+            self._log.close()
+            open(self.log_file, 'w', encoding='utf-8').close()
+            self._log = open(self.log_file, 'a', encoding='utf-8', buffering=1)
+            # Also empty the legacy JSON file, or _load_history would
+            # re-import the cleared URLs on the next startup
+            self._write_legacy()
+        logger.info("[INFO] History cleared")
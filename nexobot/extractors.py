@@ -5,13 +5,14 @@ Content extraction logic for articles.
 import re
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
+import soupsieve
 
 from .models import ContentSection
 
 
 class ContentExtractor:
     """Extracts content, metadata, and tags from HTML pages."""
-    
+
     # Priority selectors for finding main content
     CONTENT_SELECTORS = [
         'div.elementor-widget-theme-post-content',  # Elementor
@@ -22,96 +23,196 @@ class ContentExtractor:
         'div.blog-post-content',                    # Generic
         'div.single-post-content',                  # Single post themes
     ]
-    
+
     # Classes to exclude from content detection
     EXCLUDE_CLASSES = [
-        'toc', 'table-of-contents', 'widget', 'sidebar', 
+        'toc', 'table-of-contents', 'widget', 'sidebar',
         'menu', 'nav', 'header', 'footer', 'related', 'comment'
     ]
+
+    # Frozensets for O(1) membership tests in the extraction loops
+    _EXCLUDE_SET = frozenset(EXCLUDE_CLASSES)
+    _TEXT_TAGS = frozenset(['p', 'h2', 'h3', 'h4', 'blockquote'])
+    _LIST_TAGS = frozenset(['ul', 'ol'])
+
+    # Compiled once at class creation so the hot extraction path never
+    # reparses patterns or selector strings per article.
+    _COMPILED_SELECTORS = [soupsieve.compile(s) for s in CONTENT_SELECTORS]
+    # Class tokens that usually carry the publish date
+    _DATE_CLASSES = frozenset(['entry-date', 'posted-on', 'published'])
+
+    # Tags worth checking in the textual date fallback
+    _DATE_SCAN_TAGS = frozenset(['p', 'h2', 'h3', 'h4', 'span'])
+
+    # All tag sources in one selector: meta keywords, article:tag
+    # metas, rel=tag links, and links inside 'tag'-classed containers
+    _TAG_SEL = soupsieve.compile(
+        'meta[name="keywords"], meta[property="article:tag"], a[rel~="tag"], '
+        'div[class*="tag" i] a, span[class*="tag" i] a, ul[class*="tag" i] a'
+    )
+
+    # Cap for the textual date fallback so we never regex-scan a whole
+    # document's worth of text
+    _DATE_SCAN_LIMIT = 20000
+    _DATE_RE = re.compile(
+        r'(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember)'
+        r'\s+\d{1,2},\s+\d{4}'
+    )
+    _AUTHOR_RE = re.compile(r'author', re.IGNORECASE)
+    _CATEGORY_RE = re.compile(r'category', re.IGNORECASE)
     
+    def extract_all(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Extract meta, article info, tags, and content from a page.
+
+        The meta/info/tag extraction shares one document scan instead
+        of each extract_* method walking the tree separately.
+
+        Returns:
+            Dict with 'meta', 'info', 'tags', and 'content' keys.
+        """
+        meta, info, tags = self._scan_document(soup)
+        return {
+            'meta': meta,
+            'info': info,
+            'tags': list(tags),
+            'content': self.extract_content(soup),
+        }
+
     def extract_meta(self, soup: BeautifulSoup) -> Dict[str, str]:
         """Extract Open Graph and meta description."""
+        return self._scan_document(soup)[0]
+
+    def extract_article_info(self, soup: BeautifulSoup) -> Dict[str, str]:
+        """Extract author, category, and date from the page."""
+        return self._scan_document(soup)[1]
+
+    def extract_tags(self, soup: BeautifulSoup) -> List[str]:
+        """Extract article tags using multiple strategies."""
+        return list(self._scan_document(soup)[2])
+
+    def _extract_tags_into(self, soup: BeautifulSoup, tags: set):
+        """Collect tags from all sources with one selector query."""
+        for node in self._TAG_SEL.select(soup):
+            if node.name == 'meta':
+                content = node.get('content')
+                if not content:
+                    continue
+                if node.get('name') == 'keywords':
+                    for kw in content.split(','):
+                        kw = kw.strip()
+                        if kw:
+                            tags.add(kw)
+                elif content.strip():
+                    tags.add(content.strip())
+            else:
+                tag_text = node.get_text(strip=True)
+                if not tag_text:
+                    continue
+                # Container-derived links keep the old length filter;
+                # explicit rel=tag links never had one
+                if 'tag' in (node.get('rel') or []) or len(tag_text) < 50:
+                    tags.add(tag_text)
+
+    def _scan_document(self, soup: BeautifulSoup) -> tuple:
+        """
+        Collect meta fields, article info, and tags in one tree walk.
+
+        Returns:
+            Tuple of (meta dict, info dict, tag set)
+        """
         meta = {
             'og_title': '',
             'og_image': '',
             'description': '',
         }
-        
-        og_title = soup.find('meta', property='og:title')
-        if og_title:
-            meta['og_title'] = og_title.get('content', '')
-        
-        og_image = soup.find('meta', property='og:image')
-        if og_image:
-            meta['og_image'] = og_image.get('content', '')
-        
-        description = soup.find('meta', attrs={'name': 'description'})
-        if description:
-            meta['description'] = description.get('content', '')
-        
-        return meta
-    
-    def extract_article_info(self, soup: BeautifulSoup) -> Dict[str, str]:
-        """Extract author, category, and date from the page."""
         info = {
             'author': 'Unknown',
             'category': 'Unknown',
             'date': 'Unknown',
         }
-        
-        # Try to find author
-        author_elem = soup.find('a', class_=lambda c: c and 'author' in c.lower() if c else False)
-        if author_elem:
-            info['author'] = author_elem.get_text(strip=True)
-        
-        # Try to find category
-        cat_elem = soup.find('a', rel='category tag') or soup.find('a', class_=lambda c: c and 'category' in c.lower() if c else False)
-        if cat_elem:
-            info['category'] = cat_elem.get_text(strip=True)
-        
-        # Try to find date
-        date_pattern = r'(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember)\s+\d{1,2},\s+\d{4}'
-        page_text = soup.get_text()
-        date_match = re.search(date_pattern, page_text)
-        if date_match:
-            info['date'] = date_match.group(0)
-        
-        return info
-    
-    def extract_tags(self, soup: BeautifulSoup) -> List[str]:
-        """Extract article tags using multiple strategies."""
         tags = set()
-        
-        # Strategy A: Meta keywords
-        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-        if meta_keywords and meta_keywords.get('content'):
-            keywords = meta_keywords['content'].split(',')
-            for kw in keywords:
-                kw = kw.strip()
-                if kw:
-                    tags.add(kw)
-        
-        # Strategy B: Meta article:tag
-        for meta_tag in soup.find_all('meta', attrs={'property': 'article:tag'}):
-            if meta_tag.get('content'):
-                tags.add(meta_tag['content'].strip())
-        
-        # Strategy C: Visible tag links
-        for link in soup.find_all('a', rel='tag'):
-            tag_text = link.get_text(strip=True)
-            if tag_text:
-                tags.add(tag_text)
-        
-        # Strategy D: Links in tag containers
-        tag_containers = soup.find_all(['div', 'span', 'ul'], 
-            class_=lambda c: c and 'tag' in c.lower() if c else False)
-        for container in tag_containers:
-            for link in container.find_all('a'):
-                tag_text = link.get_text(strip=True)
-                if tag_text and len(tag_text) < 50:
-                    tags.add(tag_text)
-        
-        return list(tags)
+        self._extract_tags_into(soup, tags)
+
+        author_found = False
+        category_rel = None       # <a rel="category tag">, preferred
+        category_class = None     # first category-classed link
+        date_published = ''       # article:published_time meta
+        date_time_elem = ''       # first <time> element
+        date_classed = ''         # first date-classed element
+        date_text = ''            # bounded textual fallback
+        scanned = 0
+
+        for node in soup.find_all(True):
+            name = node.name
+
+            if name == 'meta':
+                content = node.get('content')
+                if not content:
+                    continue
+                prop = node.get('property')
+                if prop == 'og:title':
+                    if not meta['og_title']:
+                        meta['og_title'] = content
+                elif prop == 'og:image':
+                    if not meta['og_image']:
+                        meta['og_image'] = content
+                elif prop == 'article:published_time':
+                    if not date_published:
+                        date_published = content
+
+                if node.get('name') == 'description':
+                    if not meta['description']:
+                        meta['description'] = content
+                continue
+
+            classes = node.get('class') or []
+
+            if name == 'a':
+                rel = node.get('rel') or []
+                if not author_found and any(self._AUTHOR_RE.search(c) for c in classes):
+                    info['author'] = node.get_text(strip=True)
+                    author_found = True
+                if category_rel is None and ' '.join(rel) == 'category tag':
+                    category_rel = node.get_text(strip=True)
+                if category_class is None and any(self._CATEGORY_RE.search(c) for c in classes):
+                    category_class = node.get_text(strip=True)
+
+            elif name == 'time' and not date_time_elem:
+                if node.get('datetime'):
+                    date_time_elem = node['datetime']
+                else:
+                    date_match = self._DATE_RE.search(node.get_text(strip=True))
+                    if date_match:
+                        date_time_elem = date_match.group(0)
+
+            if not date_classed and self._DATE_CLASSES.intersection(classes):
+                date_match = self._DATE_RE.search(node.get_text(strip=True))
+                if date_match:
+                    date_classed = date_match.group(0)
+
+            # Bounded textual date fallback, only while nothing better
+            # has turned up
+            if (not (date_published or date_time_elem or date_classed or date_text)
+                    and scanned < self._DATE_SCAN_LIMIT
+                    and name in self._DATE_SCAN_TAGS):
+                text = node.get_text(strip=True)
+                date_match = self._DATE_RE.search(text)
+                if date_match:
+                    date_text = date_match.group(0)
+                else:
+                    scanned += len(text)
+
+        if category_rel is not None:
+            info['category'] = category_rel
+        elif category_class is not None:
+            info['category'] = category_class
+
+        date = date_published or date_time_elem or date_classed or date_text
+        if date:
+            info['date'] = date
+
+        return meta, info, tags
     
     def extract_content(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract main article content."""
@@ -130,16 +231,15 @@ class ContentExtractor:
         article = self._find_content_area(soup)
         
         if article:
-            content['content_html'] = self._extract_html_content(article)
-            content['sections'] = self._extract_sections(article)
-        
+            content['content_html'], content['sections'] = self._extract_both(article)
+
         return content
     
     def _find_content_area(self, soup: BeautifulSoup):
         """Find the main content area using priority selectors."""
         # Priority 1: Specific CMS classes
-        for selector in self.CONTENT_SELECTORS:
-            article = soup.select_one(selector)
+        for selector in self._COMPILED_SELECTORS:
+            article = selector.select_one(soup)
             if article:
                 return article
         
@@ -155,10 +255,10 @@ class ContentExtractor:
             classes = tag.get('class')
             if not classes:
                 return False
-            class_str = ' '.join(classes).lower()
-            if 'content' not in class_str:
+            class_tokens = {c.lower() for c in classes}
+            if not any('content' in token for token in class_tokens):
                 return False
-            if any(ex in class_str for ex in self.EXCLUDE_CLASSES):
+            if class_tokens & self._EXCLUDE_SET:
                 return False
             return True
         
@@ -169,98 +269,71 @@ class ContentExtractor:
         # Fallback to <main> or <body>
         return soup.find('main') or soup.body
     
-    def _extract_html_content(self, article) -> str:
-        """Extract content as HTML."""
+    def _extract_both(self, article) -> tuple:
+        """
+        Extract HTML content and plain-text sections in a single DOM walk.
+
+        Returns:
+            Tuple of (content_html, sections)
+        """
         if not article:
-            return ""
-        
+            return "", []
+
         html_parts = []
-        allowed_tags = ['p', 'h2', 'h3', 'h4', 'ul', 'ol', 'li', 'table', 'tr', 'td', 'th', 
-                       'strong', 'em', 'br', 'blockquote']
-        
-        for element in article.find_all(['p', 'h2', 'h3', 'h4', 'ul', 'ol', 'table', 'blockquote']):
-            if element.name in allowed_tags:
-                clean_elem = self._clean_html_element(element)
-                if clean_elem:
-                    html_parts.append(clean_elem)
-        
-        return "\n".join(html_parts)
-    
-    def _clean_html_element(self, element) -> str:
-        """Clean an HTML element, keeping only text."""
-        tag_name = element.name
-        
-        if tag_name in ['p', 'h2', 'h3', 'h4', 'blockquote']:
-            text = element.get_text(strip=True)
-            if text:
-                return f"<{tag_name}>{text}</{tag_name}>"
-            return ""
-        
-        if tag_name in ['ul', 'ol']:
-            items = element.find_all('li')
-            list_html = ''.join([f"<li>{li.get_text(strip=True)}</li>" for li in items])
-            return f"<{tag_name}>{list_html}</{tag_name}>"
-        
-        if tag_name == 'table':
-            return self._extract_table_html(element)
-        
-        return ""
-    
-    def _extract_table_html(self, table) -> str:
-        """Convert table to clean HTML."""
-        rows_html = []
-        for tr in table.find_all('tr'):
-            cells = [f"<td>{td.get_text(strip=True)}</td>" for td in tr.find_all(['td', 'th'])]
-            if cells:
-                rows_html.append(f"<tr>{''.join(cells)}</tr>")
-        return f"<table>{''.join(rows_html)}</table>"
-    
-    def _extract_sections(self, article) -> List[ContentSection]:
-        """Extract content as plain text sections."""
         intro_parts = []
         current_section = None
         sections = []
-        
-        for element in article.find_all(['p', 'h2', 'h3', 'ul', 'ol', 'table']):
+
+        # Memoize node text for this call: the same nodes (e.g. list
+        # items) feed both the HTML and the section output.
+        text_cache = {}
+
+        for element in article.find_all(['p', 'h2', 'h3', 'h4', 'ul', 'ol', 'table', 'blockquote']):
+            # HTML output
+            clean_elem = self._clean_html_element(element, text_cache)
+            if clean_elem:
+                html_parts.append(clean_elem)
+
+            # Plain-text sections (h4/blockquote only contribute to HTML)
             if element.name == 'h2':
-                heading_text = element.get_text(strip=True)
-                
+                heading_text = self._text(element, text_cache)
+
                 if current_section and current_section.content.strip():
                     sections.append(current_section)
-                
+
                 current_section = ContentSection(
                     heading=heading_text,
                     content='',
                     level=2
                 )
-                
+
             elif element.name == 'h3' and current_section:
-                current_section.content += f"\n\n### {element.get_text(strip=True)}\n"
-                
+                current_section.content += f"\n\n### {self._text(element, text_cache)}\n"
+
             elif element.name == 'p':
-                text = element.get_text(strip=True)
+                text = self._text(element, text_cache)
                 if text:
                     if current_section is None:
                         intro_parts.append(text)
                     else:
                         current_section.content += f"\n{text}"
-                        
-            elif element.name in ['ul', 'ol']:
+
+            elif element.name in self._LIST_TAGS:
                 items = element.find_all('li')
-                list_text = "\n".join([f"  • {li.get_text(strip=True)}" for li in items])
+                list_text = "\n".join(f"  • {self._text(li, text_cache)}" for li in items)
                 if current_section:
                     current_section.content += f"\n{list_text}"
                 else:
                     intro_parts.append(list_text)
-                    
+
             elif element.name == 'table':
-                table_text = self._extract_table_text(element)
+                table_text = self._extract_table_text(element, text_cache)
                 if current_section:
                     current_section.content += f"\n\n{table_text}\n"
-        
+
         if current_section and current_section.content.strip():
             sections.append(current_section)
-        
+
         # Build final sections with introduction first
         all_sections = []
         intro_text = "\n\n".join(intro_parts)
@@ -271,14 +344,53 @@ class ContentExtractor:
                 level=0
             ))
         all_sections.extend(sections)
-        
-        return all_sections
+
+        return "\n".join(html_parts), all_sections
+
+
+    def _text(self, node, cache: dict) -> str:
+        """Stripped node text, memoized per extraction call."""
+        key = id(node)
+        text = cache.get(key)
+        if text is None:
+            text = node.get_text(strip=True)
+            cache[key] = text
+        return text
+
+    def _clean_html_element(self, element, text_cache: dict) -> str:
+        """Clean an HTML element, keeping only text."""
+        tag_name = element.name
+
+        if tag_name in self._TEXT_TAGS:
+            text = self._text(element, text_cache)
+            if text:
+                return f"<{tag_name}>{text}</{tag_name}>"
+            return ""
+
+        if tag_name in self._LIST_TAGS:
+            items = element.find_all('li')
+            list_html = ''.join(f"<li>{self._text(li, text_cache)}</li>" for li in items)
+            return f"<{tag_name}>{list_html}</{tag_name}>"
+
+        if tag_name == 'table':
+            return self._extract_table_html(element, text_cache)
+
+        return ""
+
+    def _extract_table_html(self, table, text_cache: dict) -> str:
+        """Convert table to clean HTML."""
+        rows_html = []
+        for tr in table.find_all('tr'):
+            cells = [f"<td>{self._text(td, text_cache)}</td>" for td in tr.find_all(['td', 'th'])]
+            if cells:
+                rows_html.append(f"<tr>{''.join(cells)}</tr>")
+        return f"<table>{''.join(rows_html)}</table>"
     
-    def _extract_table_text(self, table) -> str:
+    def _extract_table_text(self, table, text_cache: dict) -> str:
         """Convert table to plain text."""
         rows = []
         for tr in table.find_all('tr'):
-            cells = [td.get_text(strip=True) for td in tr.find_all(['td', 'th'])]
+            cells = [self._text(td, text_cache) for td in tr.find_all(['td', 'th'])]
             if cells:
                 rows.append(" | ".join(cells))
         return "\n".join(rows)
@@ -0,0 +1,92 @@
+"""
+Shared HTTP session with connection pooling and per-host politeness.
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# Default headers applied once at session creation, so individual
+# requests don't pay for per-call header merges.
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+_session: requests.Session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide pooled session, creating it on first use.
+
+    All scraper components share this session so repeated requests to
+    the same host reuse the underlying TCP/TLS connection instead of
+    paying a fresh handshake per call.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.3),
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+    return _session
+
+
+def configure_pool(pool_connections: int, pool_maxsize: int):
+    """
+    Resize the shared session's connection pool.
+
+    Used when the number of hosts is known up front (e.g. one worker
+    per domain) so every domain can keep a warm connection instead of
+    evicting each other from the default-sized pool.
+    """
+    session = get_session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+
+class HostRateLimiter:
+    """
+    Enforces a minimum delay between requests to the same host.
+
+    Hosts don't interact, so requests to different hosts never wait on
+    each other — a global sleep would serialize a multi-host crawl for
+    no politeness benefit. Thread-safe.
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._last_hit = {}
+
+    def wait(self, url: str):
+        """Block until the host of this URL may be requested again."""
+        if self.delay <= 0:
+            return
+        host = urlparse(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                remaining = self.delay - (now - self._last_hit.get(host, 0.0))
+                if remaining <= 0:
+                    self._last_hit[host] = now
+                    return
+            time.sleep(remaining)
@@ -0,0 +1,41 @@
+"""
+JSON encoding/decoding helpers.
+
+Uses orjson (a C implementation, several times faster than the stdlib)
+when it is installed, falling back to the standard json module.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj, indent: int = 0) -> str:
+    """Serialize obj to a JSON string (UTF-8, not ASCII-escaped)."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    return json.dumps(obj, indent=indent or None, ensure_ascii=False)
+
+
+def dumps_bytes(obj, indent: int = 0) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes.
+
+    With orjson this skips the str round trip entirely, so callers
+    writing to a binary file avoid one decode and one re-encode.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=indent or None, ensure_ascii=False).encode('utf-8')
+
+
+def loads(data):
+    """Deserialize a JSON string or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
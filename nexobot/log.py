@@ -0,0 +1,51 @@
+"""
+Logging setup for the scraper.
+
+Log calls go through a QueueHandler, so emitting a record is just an
+enqueue — worker threads never contend on the stdout lock or block on
+terminal I/O. A single background QueueListener drains the queue and
+does the actual formatting and writing.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+logger = logging.getLogger('nexobot')
+
+_listener: QueueListener = None
+
+
+def setup_logging(level: int = logging.INFO) -> logging.Logger:
+    """
+    Route the 'nexobot' logger through a background listener.
+
+    Called once at CLI entry; safe to call again (subsequent calls are
+    no-ops). Messages keep their existing [INFO]/[ERROR] prefixes, so
+    the console output format is unchanged.
+    """
+    global _listener
+    if _listener is not None:
+        return logger
+
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter('%(message)s'))
+
+    _listener = QueueListener(log_queue, console)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+
+def shutdown_logging():
+    """Stop the listener, draining any queued records first."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
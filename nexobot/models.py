@@ -2,10 +2,12 @@
 Data models for article content.
 """
 
+import io
 from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
-import json
+
+from . import jsonutil
 
 
 @dataclass
@@ -29,10 +31,18 @@ class ArticleContent:
     sections: List[ContentSection] = field(default_factory=list)
     tags: List[str] = field(default_factory=list)
     scraped_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    
+
+    # Serialization caches: articles are effectively immutable once
+    # scraped, and to_dict/to_json run at least twice per article
+    # (file output plus the Airtable JSON field).
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _json_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
+        if self._dict_cache is not None:
+            return self._dict_cache
+        self._dict_cache = {
             'url': self.url,
             'title': self.title,
             'author': self.author,
@@ -51,49 +61,59 @@ class ArticleContent:
             'tags': self.tags,
             'scraped_at': self.scraped_at
         }
-    
+        return self._dict_cache
+
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+        cached = self._json_cache.get(indent)
+        if cached is None:
+            cached = jsonutil.dumps(self.to_dict(), indent=indent)
+            self._json_cache[indent] = cached
+        return cached
+
+    def to_json_bytes(self, indent: int = 2) -> bytes:
+        """Convert to UTF-8 JSON bytes for binary file output."""
+        cached = self._json_cache.get(indent)
+        if cached is not None:
+            return cached.encode('utf-8')
+        return jsonutil.dumps_bytes(self.to_dict(), indent=indent)
     
     def to_text(self) -> str:
         """Convert to plain text format."""
-        lines = [
-            f"Title: {self.title}",
-            f"URL: {self.url}",
-            f"Author: {self.author}",
-            f"Date: {self.publish_date}",
-            f"Category: {self.category}",
-            "",
-            "=" * 60,
-            ""
-        ]
-        
+        buf = io.StringIO()
+        buf.write(f"Title: {self.title}\n")
+        buf.write(f"URL: {self.url}\n")
+        buf.write(f"Author: {self.author}\n")
+        buf.write(f"Date: {self.publish_date}\n")
+        buf.write(f"Category: {self.category}\n\n")
+        buf.write("=" * 60)
+        buf.write("\n")
+
         for section in self.sections:
             if section.heading:
-                lines.append(f"\n## {section.heading}\n")
-            lines.append(section.content)
-        
-        return "\n".join(lines)
-    
+                buf.write(f"\n\n## {section.heading}\n\n")
+            else:
+                buf.write("\n")
+            buf.write(section.content)
+
+        return buf.getvalue()
+
     def to_markdown(self) -> str:
         """Convert to Markdown format."""
-        lines = [
-            f"# {self.title}",
-            "",
-            f"**URL:** {self.url}",
-            f"**Author:** {self.author}",
-            f"**Date:** {self.publish_date}",
-            f"**Category:** {self.category}",
-            "",
-            "---",
-            ""
-        ]
-        
+        buf = io.StringIO()
+        buf.write(f"# {self.title}\n\n")
+        buf.write(f"**URL:** {self.url}\n")
+        buf.write(f"**Author:** {self.author}\n")
+        buf.write(f"**Date:** {self.publish_date}\n")
+        buf.write(f"**Category:** {self.category}\n\n")
+        buf.write("---\n")
+
         for section in self.sections:
             if section.heading:
                 prefix = "#" * (section.level + 1)
-                lines.append(f"\n{prefix} {section.heading}\n")
-            lines.append(section.content)
-        
-        return "\n".join(lines)
+                buf.write(f"\n\n{prefix} {section.heading}\n\n")
+            else:
+                buf.write("\n")
+            buf.write(section.content)
+
+        return buf.getvalue()
@@ -2,51 +2,87 @@
 Main Scraper class that orchestrates the scraping workflow.
 """
 
+import itertools
+import re
+import threading
 import requests
-import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED
+from concurrent.futures import wait as futures_wait
 from typing import Optional, List
 from bs4 import BeautifulSoup
 
+from .log import logger
 from .models import ArticleContent
 from .validators import URLValidator
 from .extractors import ContentExtractor
+from .http import get_session, HostRateLimiter
 from .sitemap import SitemapParser, discover_sitemap
 
 
 class Scraper:
     """Main scraper class for extracting article content from websites."""
-    
-    HEADERS = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-    }
-    
-    def __init__(self, min_path_depth: int = 3, timeout: int = 30):
+
+    # Content types worth parsing as HTML
+    _HTML_CONTENT_RE = re.compile(r'text/html|application/xhtml\+xml', re.IGNORECASE)
+
+    # Give up on pages larger than this; article pages don't come
+    # close, and it stops a runaway download from filling memory
+    MAX_PAGE_BYTES = 10 * 1024 * 1024
+
+    def __init__(self, min_path_depth: int = 3, timeout: int = 30,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the scraper.
-        
+
         Args:
             min_path_depth: Minimum URL path segments for valid posts.
             timeout: Request timeout in seconds.
+            session: Optional requests.Session. Defaults to the shared
+                     pooled session so connections are reused.
         """
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update(self.HEADERS)
-        
+        self.session = session or get_session()
+
         self.url_validator = URLValidator(min_path_depth=min_path_depth)
         self.extractor = ContentExtractor()
-        self.sitemap_parser = SitemapParser()
+        self.sitemap_parser = SitemapParser(session=self.session)
     
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse a web page."""
+        """
+        Fetch and parse a web page.
+
+        The response is streamed: the Content-Type check runs on the
+        headers alone, so skipped responses (PDFs, images, feeds)
+        never download their body, and the download is capped at
+        MAX_PAGE_BYTES.
+        """
         try:
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(url, timeout=self.timeout, stream=True)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'lxml')
+
+            # Don't hand PDFs, images, or feeds to the HTML parser
+            content_type = response.headers.get('Content-Type', '')
+            if content_type and not self._HTML_CONTENT_RE.search(content_type):
+                logger.info(f"[SKIP] {url}")
+                logger.info(f"       Reason: Not an HTML page ({content_type.split(';')[0].strip()})")
+                response.close()
+                return None
+
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > self.MAX_PAGE_BYTES:
+                    logger.info(f"[SKIP] {url}")
+                    logger.info(f"       Reason: Page exceeds {self.MAX_PAGE_BYTES} bytes")
+                    response.close()
+                    return None
         except requests.RequestException as e:
-            print(f"[ERROR] Failed to fetch {url}: {e}")
+            logger.error(f"[ERROR] Failed to fetch {url}: {e}")
             return None
+
+        return BeautifulSoup(b''.join(chunks), 'lxml')
     
     def is_valid_article(self, content: dict) -> tuple[bool, str]:
         """Validate that extracted content looks like an article."""
@@ -79,28 +115,29 @@ class Scraper:
         if validate_url:
             is_valid, reason = self.url_validator.is_single_post(url)
             if not is_valid:
-                print(f"[SKIP] {url}")
-                print(f"       Reason: {reason}")
+                logger.info(f"[SKIP] {url}")
+                logger.info(f"       Reason: {reason}")
                 return None
         
-        print(f"[INFO] Scraping: {url}")
+        logger.info(f"[INFO] Scraping: {url}")
         
         # Step 2: Fetch page
         soup = self.fetch_page(url)
         if not soup:
             return None
         
-        # Step 3: Extract content
-        meta = self.extractor.extract_meta(soup)
-        info = self.extractor.extract_article_info(soup)
-        content = self.extractor.extract_content(soup)
-        tags = self.extractor.extract_tags(soup)
-        
+        # Step 3: Extract content (one fused pass for meta/info/tags)
+        extracted = self.extractor.extract_all(soup)
+        meta = extracted['meta']
+        info = extracted['info']
+        content = extracted['content']
+        tags = extracted['tags']
+
         # Step 4: Validate content
         is_valid, reason = self.is_valid_article(content)
         if not is_valid:
-            print(f"[SKIP] {url}")
-            print(f"       Reason: {reason}")
+            logger.info(f"[SKIP] {url}")
+            logger.info(f"       Reason: {reason}")
             return None
         
         article = ArticleContent(
@@ -115,68 +152,100 @@ class Scraper:
             tags=tags,
         )
         
-        print(f"[SUCCESS] Scraped: {article.title}")
+        logger.info(f"[SUCCESS] Scraped: {article.title}")
         return article
     
-    def scrape_from_sitemap(self, 
+    def scrape_from_sitemap(self,
                             sitemap_url: str = None,
                             base_url: str = "https://cetta.id",
                             url_filter: str = None,
                             max_articles: int = 10,
-                            delay: float = 1.0):
+                            delay: float = 1.0,
+                            concurrency: int = 4):
         """
         Scrape multiple articles from a sitemap.
-        Yields ArticleContent objects one by one.
-        
+        Yields ArticleContent objects as they complete.
+
         Args:
             sitemap_url: Direct URL to sitemap. If None, will try to discover.
             base_url: Base URL of the website for sitemap discovery.
             url_filter: Regex pattern to filter URLs.
             max_articles: Maximum number of articles to scrape.
-            delay: Delay between requests in seconds.
-        
+            delay: Minimum delay between requests to the same host.
+            concurrency: Maximum pages fetched in parallel.
+
         Yields:
             ArticleContent objects
         """
         if not sitemap_url:
             sitemap_url = discover_sitemap(base_url)
             if not sitemap_url:
-                print(f"[ERROR] Could not find sitemap for {base_url}")
+                logger.error(f"[ERROR] Could not find sitemap for {base_url}")
                 return
         
-        # Get all URLs from sitemap
-        # If max_articles is None (scrape all), we don't limit discovery
-        fetch_limit = max_articles * 3 if max_articles is not None else None
-        
-        all_entries = list(self.sitemap_parser.get_all_urls(
-            sitemap_url, 
-            url_filter=url_filter,
-            max_urls=fetch_limit
-        ))
-        
-        # Filter valid URLs
+        # Validate entries as the sitemap streams in and stop as soon
+        # as enough valid URLs are collected — abandoning the generator
+        # also stops fetching further child sitemaps.
         valid_urls = []
-        for entry in all_entries:
+        for entry in self.sitemap_parser.get_all_urls(sitemap_url, url_filter=url_filter):
             is_valid, _ = self.url_validator.is_single_post(entry.url)
             if is_valid:
                 valid_urls.append(entry)
                 if max_articles is not None and len(valid_urls) >= max_articles:
                     break
         
-        print(f"[INFO] Found {len(valid_urls)} valid URLs to scrape")
-        
+        total = len(valid_urls)
+        logger.info(f"[INFO] Found {total} valid URLs to scrape")
+
+        if not valid_urls:
+            logger.info(f"\n[COMPLETE] Scraped 0 articles successfully")
+            return
+
+        # Fetches overlap on a bounded pool; the limiter still spaces
+        # out requests that land on the same host. Entries are
+        # submitted lazily — at most `concurrency` in flight — so
+        # abandoning this generator (worker stop, early break) cancels
+        # the rest instead of draining the whole sitemap.
+        limiter = HostRateLimiter(delay)
+        cancelled = threading.Event()
+
+        def _scrape_entry(entry):
+            if cancelled.is_set():
+                return None
+            limiter.wait(entry.url)
+            if cancelled.is_set():
+                return None
+            return self.scrape(entry.url, validate_url=False)
+
         count = 0
-        for i, entry in enumerate(valid_urls, 1):
-            print(f"\n[{i}/{len(valid_urls)}] Processing: {entry.url}")
-            
-            article = self.scrape(entry.url, validate_url=False)
-            if article:
-                yield article
-                count += 1
-            
-            if i < len(valid_urls):
-                time.sleep(delay)
-        
-        print(f"\n[COMPLETE] Scraped {count} articles successfully")
+        processed = 0
+        entries = iter(valid_urls)
+        pool = ThreadPoolExecutor(max_workers=min(concurrency, total))
+        try:
+            pending = {pool.submit(_scrape_entry, entry): entry
+                       for entry in itertools.islice(entries, min(concurrency, total))}
+            while pending:
+                done, _ = futures_wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entry = pending.pop(future)
+                    next_entry = next(entries, None)
+                    if next_entry is not None:
+                        pending[pool.submit(_scrape_entry, next_entry)] = next_entry
+
+                    processed += 1
+                    logger.info(f"\n[{processed}/{total}] Processed: {entry.url}")
+                    try:
+                        article = future.result()
+                    except Exception as e:
+                        logger.error(f"[ERROR] Failed to scrape {entry.url}: {e}")
+                        continue
+                    if article:
+                        yield article
+                        count += 1
+        finally:
+            cancelled.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        logger.info(f"\n[COMPLETE] Scraped {count} articles successfully")
         
 
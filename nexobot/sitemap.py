@@ -2,11 +2,34 @@
 Sitemap parsing and discovery.
 """
 
+import functools
+import gzip
 import re
+import threading
+import zlib
 import requests
-from typing import List, Optional, Generator
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Optional, Generator
 from dataclasses import dataclass
-from bs4 import BeautifulSoup
+from lxml import etree
+
+from .http import get_session
+from .log import logger
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_filter(pattern: str) -> re.Pattern:
+    """Compiled URL-filter regex, cached so repeated get_all_urls calls
+    with the same filter don't recompile it."""
+    return re.compile(pattern)
+
+
+def _localname(tag) -> str:
+    """Element tag without its XML namespace prefix."""
+    if isinstance(tag, str) and tag.startswith('{'):
+        return tag.rsplit('}', 1)[1]
+    return tag
 
 
 @dataclass
@@ -22,66 +45,101 @@ class SitemapParser:
     """Parser for XML sitemaps with support for sitemap indexes."""
     
     HEADERS = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
         'Accept': 'application/xml,text/xml,*/*',
+        'Accept-Encoding': 'gzip, deflate',
     }
-    
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(self.HEADERS)
-    
-    def fetch_sitemap(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse a sitemap XML."""
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session or get_session()
+
+    def fetch_sitemap(self, url: str) -> Optional[bytes]:
+        """
+        Fetch a sitemap and return the raw XML bytes.
+
+        Handles gzipped sitemaps (sitemap.xml.gz): transport-level gzip
+        is undone by requests, but .gz files usually arrive as
+        octet-stream payloads, so the gzip magic bytes are sniffed and
+        the body decompressed before parsing.
+        """
         try:
-            print(f"[INFO] Fetching sitemap: {url}")
-            response = self.session.get(url, timeout=30)
+            logger.info(f"[INFO] Fetching sitemap: {url}")
+            response = self.session.get(url, timeout=30, headers=self.HEADERS)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'lxml-xml')
         except requests.RequestException as e:
-            print(f"[ERROR] Failed to fetch sitemap: {e}")
+            logger.error(f"[ERROR] Failed to fetch sitemap: {e}")
             return None
-    
-    def is_sitemap_index(self, soup: BeautifulSoup) -> bool:
-        """Check if the sitemap is a sitemap index."""
-        return soup.find('sitemapindex') is not None
-    
-    def parse_sitemap_index(self, soup: BeautifulSoup) -> List[str]:
-        """Extract sitemap URLs from a sitemap index."""
-        sitemaps = []
-        for sitemap in soup.find_all('sitemap'):
-            loc = sitemap.find('loc')
-            if loc:
-                sitemaps.append(loc.get_text(strip=True))
-        return sitemaps
-    
-    def parse_urlset(self, soup: BeautifulSoup) -> List[SitemapEntry]:
-        """Extract URL entries from a regular sitemap."""
-        entries = []
-        for url_elem in soup.find_all('url'):
-            loc = url_elem.find('loc')
-            if not loc:
-                continue
-            
-            entry = SitemapEntry(url=loc.get_text(strip=True))
-            
-            lastmod = url_elem.find('lastmod')
-            if lastmod:
-                entry.lastmod = lastmod.get_text(strip=True)
-            
-            changefreq = url_elem.find('changefreq')
-            if changefreq:
-                entry.changefreq = changefreq.get_text(strip=True)
-            
-            priority = url_elem.find('priority')
-            if priority:
-                try:
-                    entry.priority = float(priority.get_text(strip=True))
-                except ValueError:
-                    pass
-            
-            entries.append(entry)
-        
-        return entries
+
+        data = response.content
+        if data[:2] == b'\x1f\x8b':
+            try:
+                data = gzip.decompress(data)
+            except (OSError, EOFError, zlib.error) as e:
+                logger.error(f"[ERROR] Failed to decompress sitemap: {e}")
+                return None
+        return data
+
+    def is_sitemap_index(self, xml_bytes: bytes) -> bool:
+        """Check if the sitemap is a sitemap index by its root tag."""
+        try:
+            for _, elem in etree.iterparse(BytesIO(xml_bytes), events=('start',)):
+                return _localname(elem.tag) == 'sitemapindex'
+        except etree.XMLSyntaxError as e:
+            logger.error(f"[ERROR] Invalid sitemap XML: {e}")
+        return False
+
+    def parse_sitemap_index(self, xml_bytes: bytes) -> Generator[str, None, None]:
+        """Stream sitemap URLs from a sitemap index."""
+        try:
+            for _, elem in etree.iterparse(BytesIO(xml_bytes), events=('end',)):
+                if _localname(elem.tag) != 'sitemap':
+                    continue
+                for child in elem:
+                    if _localname(child.tag) == 'loc' and child.text:
+                        yield child.text.strip()
+                        break
+                # Release the subtree so memory stays flat on big indexes
+                elem.clear(keep_tail=True)
+        except etree.XMLSyntaxError as e:
+            logger.error(f"[ERROR] Invalid sitemap XML: {e}")
+
+    def parse_urlset(self, xml_bytes: bytes) -> Generator[SitemapEntry, None, None]:
+        """
+        Stream URL entries from a regular sitemap.
+
+        Uses etree.iterparse so entries are yielded as they are parsed
+        and each <url> subtree is freed immediately, instead of building
+        a full DOM for sitemaps with tens of thousands of entries.
+        """
+        try:
+            for _, elem in etree.iterparse(BytesIO(xml_bytes), events=('end',)):
+                if _localname(elem.tag) != 'url':
+                    continue
+
+                # One pass over the children instead of a findtext
+                # scan per field
+                entry = SitemapEntry(url='')
+                for child in elem:
+                    text = child.text.strip() if child.text else ''
+                    if not text:
+                        continue
+                    name = _localname(child.tag)
+                    if name == 'loc':
+                        entry.url = text
+                    elif name == 'lastmod':
+                        entry.lastmod = text
+                    elif name == 'changefreq':
+                        entry.changefreq = text
+                    elif name == 'priority':
+                        try:
+                            entry.priority = float(text)
+                        except ValueError:
+                            pass
+
+                elem.clear(keep_tail=True)
+                if entry.url:
+                    yield entry
+        except etree.XMLSyntaxError as e:
+            logger.error(f"[ERROR] Invalid sitemap XML: {e}")
     
     def get_all_urls(self, sitemap_url: str, 
                      url_filter: Optional[str] = None,
@@ -98,15 +156,15 @@ class SitemapParser:
             SitemapEntry objects
         """
         count = 0
-        pattern = re.compile(url_filter) if url_filter else None
+        pattern = _compile_filter(url_filter) if url_filter else None
         
-        soup = self.fetch_sitemap(sitemap_url)
-        if not soup:
+        xml_bytes = self.fetch_sitemap(sitemap_url)
+        if not xml_bytes:
             return
-        
-        if self.is_sitemap_index(soup):
-            print(f"[INFO] Found sitemap index with nested sitemaps")
-            child_sitemaps = self.parse_sitemap_index(soup)
+
+        if self.is_sitemap_index(xml_bytes):
+            logger.info(f"[INFO] Found sitemap index with nested sitemaps")
+            child_sitemaps = list(self.parse_sitemap_index(xml_bytes))
             
             # Smart filtering: If we see sitemaps with "post" in the name, 
             # we prioritize them and ignore others (like page, category, etc.)
@@ -115,7 +173,7 @@ class SitemapParser:
             target_sitemaps = post_sitemaps if post_sitemaps else child_sitemaps
             
             if post_sitemaps:
-                print(f"[INFO] Filtering for post sitemaps only ({len(post_sitemaps)} found)")
+                logger.info(f"[INFO] Filtering for post sitemaps only ({len(post_sitemaps)} found)")
             
             for child_sitemap_url in target_sitemaps:
                 if max_urls and count >= max_urls:
@@ -127,9 +185,9 @@ class SitemapParser:
                     if any(k in child_sitemap_url.lower() for k in ignore_keywords):
                         continue
 
-                child_soup = self.fetch_sitemap(child_sitemap_url)
-                if child_soup:
-                    for entry in self.parse_urlset(child_soup):
+                child_bytes = self.fetch_sitemap(child_sitemap_url)
+                if child_bytes:
+                    for entry in self.parse_urlset(child_bytes):
                         if max_urls and count >= max_urls:
                             break
                         if pattern and not pattern.search(entry.url):
@@ -137,7 +195,7 @@ class SitemapParser:
                         yield entry
                         count += 1
         else:
-            for entry in self.parse_urlset(soup):
+            for entry in self.parse_urlset(xml_bytes):
                 if max_urls and count >= max_urls:
                     break
                 if pattern and not pattern.search(entry.url):
@@ -145,14 +203,35 @@ class SitemapParser:
                 yield entry
                 count += 1
         
-        print(f"[INFO] Found {count} URLs matching criteria")
+        logger.info(f"[INFO] Found {count} URLs matching criteria")
+
+
+# Successful discoveries per base URL. Failures are deliberately not
+# cached: a transient outage at startup shouldn't pin "no sitemap" for
+# the life of the process — the next cycle retries.
+_discovered_sitemaps: dict = {}
+_discovered_lock = threading.Lock()
 
 
 def discover_sitemap(base_url: str) -> Optional[str]:
     """
     Try to discover the sitemap URL for a website.
     Checks common locations like /sitemap.xml, /sitemap_index.xml, etc.
+
+    All candidate paths are probed concurrently over the shared pooled
+    session, so discovery costs one round trip instead of six serial
+    ones; the highest-priority path that answers 200 still wins.
+
+    Successful lookups are cached per base URL so repeated calls for
+    the same domain (e.g. across worker cycles) don't re-probe the
+    site; failed lookups are retried on the next call.
     """
+    base_url = base_url.rstrip('/')
+
+    cached = _discovered_sitemaps.get(base_url)
+    if cached:
+        return cached
+
     common_paths = [
         '/sitemap.xml',
         '/sitemap_index.xml',
@@ -161,18 +240,26 @@ def discover_sitemap(base_url: str) -> Optional[str]:
         '/page-sitemap.xml',
         '/wp-sitemap.xml',
     ]
-    
-    base_url = base_url.rstrip('/')
-    
-    for path in common_paths:
-        url = base_url + path
+
+    session = get_session()
+
+    def _probe(url: str) -> bool:
         try:
-            response = requests.head(url, timeout=10, allow_redirects=True)
-            if response.status_code == 200:
-                print(f"[INFO] Found sitemap at: {url}")
-                return url
+            response = session.head(url, timeout=10, allow_redirects=True)
+            return response.status_code == 200
         except requests.RequestException:
-            continue
-    
-    print(f"[WARNING] Could not find sitemap for {base_url}")
+            return False
+
+    candidates = [base_url + path for path in common_paths]
+    with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+        results = pool.map(_probe, candidates)
+
+    for url, found in zip(candidates, results):
+        if found:
+            logger.info(f"[INFO] Found sitemap at: {url}")
+            with _discovered_lock:
+                _discovered_sitemaps[base_url] = url
+            return url
+
+    logger.warning(f"[WARNING] Could not find sitemap for {base_url}")
     return None
@@ -4,11 +4,34 @@ Storage utilities for saving scraped articles.
 
 import os
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
 from .models import ArticleContent
 from .config import AirtableConfig
+from .log import logger
+
+
+class _FilenameTable(dict):
+    """
+    Translation table for str.translate that keeps alphanumerics,
+    spaces, hyphens, and underscores and deletes everything else.
+
+    Entries are computed on first sight of each codepoint and cached,
+    so sanitizing a title is one C-level pass instead of a Python loop
+    calling isalnum() per character.
+    """
+
+    def __missing__(self, codepoint):
+        ch = chr(codepoint)
+        keep = ch if (ch.isalnum() or ch in ' -_') else None
+        self[codepoint] = keep
+        return keep
+
+
+_FILENAME_TABLE = _FilenameTable()
 
 
 class ArticleStorage:
@@ -18,23 +41,34 @@ class ArticleStorage:
         self.output_dir = output_dir
         self.airtable_config = airtable_config
         self._airtable_client = None
+        # Airtable uploads run on a background pool so the scrape loop
+        # never blocks on Airtable latency. The semaphore bounds
+        # in-flight uploads so a slow API can't queue unbounded work.
+        self._upload_pool = None
+        self._upload_slots = threading.Semaphore(32)
+        # Guards the lazy client/pool creation: one storage is shared
+        # across worker threads, and racing inits would leak a second
+        # executor whose uploads escape flush()
+        self._init_lock = threading.Lock()
         os.makedirs(output_dir, exist_ok=True)
     
     @property
     def airtable_client(self):
         """Lazy-load Airtable client."""
         if self._airtable_client is None and self.airtable_config and self.airtable_config.is_configured:
-            from .integrations.airtable import AirtableClient
-            self._airtable_client = AirtableClient(
-                api_key=self.airtable_config.api_key,
-                base_id=self.airtable_config.base_id,
-                table_id=self.airtable_config.table_id
-            )
+            with self._init_lock:
+                if self._airtable_client is None:
+                    from .integrations.airtable import AirtableClient
+                    self._airtable_client = AirtableClient(
+                        api_key=self.airtable_config.api_key,
+                        base_id=self.airtable_config.base_id,
+                        table_id=self.airtable_config.table_id
+                    )
         return self._airtable_client
     
     def _generate_filename(self, article: ArticleContent, ext: str) -> str:
         """Generate a unique filename based on article title."""
-        safe_title = "".join(c for c in article.title if c.isalnum() or c in (' ', '-', '_'))
+        safe_title = article.title.translate(_FILENAME_TABLE)
         safe_title = safe_title.replace(' ', '_')[:50]
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -60,27 +94,48 @@ class ArticleStorage:
         elif output_format == 'md':
             return self._save_markdown(article) is not None
         else:
-            print(f"[WARNING] Unknown output format: {output_format}, using json")
+            logger.warning(f"[WARNING] Unknown output format: {output_format}, using json")
             return self._save_json(article) is not None
     
     def _save_to_airtable(self, article: ArticleContent) -> bool:
-        """Save article to Airtable."""
+        """Queue article for upload to Airtable in the background."""
         if not self.airtable_client:
-            print("[ERROR] Airtable not configured")
+            logger.error("[ERROR] Airtable not configured")
             return False
-        
-        record_id = self.airtable_client.create_record(article)
-        return record_id is not None
+
+        if self._upload_pool is None:
+            with self._init_lock:
+                if self._upload_pool is None:
+                    self._upload_pool = ThreadPoolExecutor(max_workers=4)
+
+        self._upload_slots.acquire()
+        self._upload_pool.submit(self._upload_record, article)
+        return True
+
+    def _upload_record(self, article: ArticleContent):
+        """Upload one article from the background pool."""
+        try:
+            self.airtable_client.create_record(article)
+        finally:
+            self._upload_slots.release()
+
+    def flush(self):
+        """Wait for queued uploads and drain the Airtable batch buffer."""
+        if self._upload_pool is not None:
+            self._upload_pool.shutdown(wait=True)
+            self._upload_pool = None
+        if self._airtable_client is not None:
+            self._airtable_client.flush()
     
     def _save_json(self, article: ArticleContent) -> str:
         """Save article as JSON."""
         filename = self._generate_filename(article, 'json')
         filepath = os.path.join(self.output_dir, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(article.to_json())
+        with open(filepath, 'wb') as f:
+            f.write(article.to_json_bytes())
         
-        print(f"[SAVED] {filepath}")
+        logger.info(f"[SAVED] {filepath}")
         return filepath
     
     def _save_text(self, article: ArticleContent) -> str:
@@ -91,7 +146,7 @@ class ArticleStorage:
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(article.to_text())
         
-        print(f"[SAVED] {filepath}")
+        logger.info(f"[SAVED] {filepath}")
         return filepath
     
     def _save_markdown(self, article: ArticleContent) -> str:
@@ -102,5 +157,5 @@ class ArticleStorage:
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(article.to_markdown())
         
-        print(f"[SAVED] {filepath}")
+        logger.info(f"[SAVED] {filepath}")
         return filepath
@@ -2,8 +2,19 @@
 URL validation logic for distinguishing articles from archive pages.
 """
 
+import functools
 import re
-from urllib.parse import urlparse, parse_qs
+from typing import Optional
+from urllib.parse import urlparse, parse_qs, ParseResult
+
+
+@functools.lru_cache(maxsize=16384)
+def _parse_url(url: str) -> ParseResult:
+    """
+    Cached urlparse. The same URL string is typically parsed several
+    times across validation, sitemap discovery, and history checks.
+    """
+    return urlparse(url)
 
 
 class URLValidator:
@@ -37,9 +48,23 @@ class URLValidator:
     
     # Pagination query parameters
     PAGINATION_PARAMS = ['page', 'paged', 'p', 'offset']
-    
+
     # Common subdomains that indicate blog/article hosting
-    BLOG_SUBDOMAINS = ['blog', 'news', 'articles', 'content']
+    BLOG_SUBDOMAINS = frozenset(['blog', 'news', 'articles', 'content'])
+
+    # /page/N in the path, compiled once instead of per call
+    _PAGE_PATH_RE = re.compile(r'/page/\d+')
+
+    # Fused alternations so archive classification is one search
+    # instead of a loop over ten compiled patterns. Compiled at class
+    # creation and shared by every instance. Two variants: subdomain
+    # URLs skip the single-segment pattern (index 1), since /slug on
+    # blog.site.com is a post, not an archive.
+    _archive_re = re.compile(
+        '|'.join(f'(?:{p})' for p in ARCHIVE_PATTERNS), re.IGNORECASE)
+    _archive_re_subdomain = re.compile(
+        '|'.join(f'(?:{p})' for i, p in enumerate(ARCHIVE_PATTERNS) if i != 1),
+        re.IGNORECASE)
     
     def __init__(self, min_path_depth: int = 3):
         """
@@ -48,19 +73,18 @@ class URLValidator:
                            e.g., /updates/category/slug = 3 segments
         """
         self.min_path_depth = min_path_depth
-        self.archive_patterns = [re.compile(p, re.IGNORECASE) for p in self.ARCHIVE_PATTERNS]
     
-    def get_path_depth(self, url: str) -> int:
+    def get_path_depth(self, url: str, parsed: Optional[ParseResult] = None) -> int:
         """Count the number of path segments in a URL."""
-        parsed = urlparse(url)
+        parsed = parsed or _parse_url(url)
         path = parsed.path.strip('/')
         if not path:
             return 0
         return len(path.split('/'))
-    
-    def has_pagination(self, url: str) -> bool:
+
+    def has_pagination(self, url: str, parsed: Optional[ParseResult] = None) -> bool:
         """Check if URL has pagination parameters."""
-        parsed = urlparse(url)
+        parsed = parsed or _parse_url(url)
         query_params = parse_qs(parsed.query)
         
         for param in self.PAGINATION_PARAMS:
@@ -68,37 +92,28 @@ class URLValidator:
                 return True
         
         # Also check for /page/N in path
-        if re.search(r'/page/\d+', parsed.path):
+        if self._PAGE_PATH_RE.search(parsed.path):
             return True
         
         return False
     
-    def matches_archive_pattern(self, url: str) -> bool:
+    def matches_archive_pattern(self, url: str, parsed: Optional[ParseResult] = None) -> bool:
         """Check if URL matches common archive patterns."""
-        parsed = urlparse(url)
-        path = parsed.path
-        
-        # Check if URL has a blog-style subdomain
-        is_subdomain = self.has_subdomain(url)
-        
-        for i, pattern in enumerate(self.archive_patterns):
-            # Skip single-segment pattern (index 1) for subdomain URLs
-            if i == 1 and is_subdomain:
-                continue
-            if pattern.search(path):
-                return True
-        
-        return False
+        parsed = parsed or _parse_url(url)
+
+        pattern = (self._archive_re_subdomain if self.has_subdomain(url, parsed)
+                   else self._archive_re)
+        return pattern.search(parsed.path) is not None
     
-    def is_root_domain(self, url: str) -> bool:
+    def is_root_domain(self, url: str, parsed: Optional[ParseResult] = None) -> bool:
         """Check if URL is a root domain (no path, or just /)."""
-        parsed = urlparse(url)
+        parsed = parsed or _parse_url(url)
         path = parsed.path.strip('/')
         return not path and not parsed.query
-    
-    def has_subdomain(self, url: str) -> bool:
+
+    def has_subdomain(self, url: str, parsed: Optional[ParseResult] = None) -> bool:
         """Check if URL has a subdomain like blog.site.com."""
-        parsed = urlparse(url)
+        parsed = parsed or _parse_url(url)
         hostname = parsed.netloc.lower()
         
         parts = hostname.split('.')
@@ -112,28 +127,37 @@ class URLValidator:
     def is_single_post(self, url: str) -> tuple[bool, str]:
         """
         Determine if a URL is likely a single post.
-        
+
+        Results are memoized process-wide: sitemap scraping and the
+        worker cycles re-validate the same URLs, and classification
+        only depends on the URL and min_path_depth.
+
         Returns:
             Tuple of (is_valid, reason)
         """
-        parsed = urlparse(url)
+        return _classify_single_post(url, self.min_path_depth)
+
+    def _classify_single_post(self, url: str) -> tuple[bool, str]:
+        """Uncached single-post classification backing is_single_post."""
+        # Parse once and thread the result through every helper
+        parsed = _parse_url(url)
         path = parsed.path.strip('/')
-        
+
         # Check 0: If it's a root domain, it's not a single post
-        if self.is_root_domain(url):
+        if self.is_root_domain(url, parsed):
             return False, "URL is a root domain (use sitemap discovery)"
-        
+
         # Check 1: Has pagination = not a single post
-        if self.has_pagination(url):
+        if self.has_pagination(url, parsed):
             return False, "URL has pagination parameters"
-        
+
         # Check 2: Matches archive pattern
-        if self.matches_archive_pattern(url):
+        if self.matches_archive_pattern(url, parsed):
             return False, "URL matches archive pattern"
-        
+
         # Check 3: Path depth check (adjusted for subdomains)
-        depth = self.get_path_depth(url)
-        min_depth = 1 if self.has_subdomain(url) else self.min_path_depth
+        depth = self.get_path_depth(url, parsed)
+        min_depth = 1 if self.has_subdomain(url, parsed) else self.min_path_depth
         
         if depth < min_depth:
             return False, f"URL path too shallow ({depth} segments, need {min_depth})"
@@ -144,5 +168,15 @@ class URLValidator:
         
         if not last_segment or last_segment.isdigit():
             return False, "URL doesn't end with a valid slug"
-        
+
         return True, "Valid single post URL"
+
+
+@functools.lru_cache(maxsize=100_000)
+def _classify_single_post(url: str, min_path_depth: int) -> tuple[bool, str]:
+    """
+    Cached single-post classification. URLValidator holds no state
+    beyond min_path_depth, so (url, min_path_depth) fully determines
+    the answer and the cache can be shared across all instances.
+    """
+    return URLValidator(min_path_depth)._classify_single_post(url)
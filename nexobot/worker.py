@@ -5,14 +5,18 @@ One worker per unique domain, running independently.
 
 import threading
 import signal
-import time
+from urllib import robotparser
 from urllib.parse import urlparse
 from typing import Dict, List, Optional
 from collections import defaultdict
 
+import requests
+
 from .scraper import Scraper
 from .storage import ArticleStorage
 from .config import ScraperConfig, HistoryManager
+from .http import configure_pool, DEFAULT_HEADERS
+from .log import logger
 from .sitemap import discover_sitemap
 
 
@@ -39,46 +43,88 @@ class DomainWorker(threading.Thread):
         self.cycle_delay = cycle_delay
         self.request_delay = request_delay
         self.max_articles = max_articles
-        self.running = True
+        self._stop_event = threading.Event()
+        self._seen_this_cycle = set()
+        self._robots: Optional[robotparser.RobotFileParser] = None
+        self.effective_delay = request_delay
         self.name = f"Worker-{domain}"
-    
+
     def stop(self):
         """Signal the worker to stop."""
-        self.running = False
-    
+        self._stop_event.set()
+
+    def _load_robots(self):
+        """
+        Fetch this domain's robots.txt once and honor its hints: the
+        per-request delay is raised to any advertised Crawl-delay, and
+        disallowed URLs are skipped in _process_urls. Domains without
+        a readable robots.txt keep the configured behavior.
+        """
+        rp = robotparser.RobotFileParser()
+        for scheme in ('https', 'http'):
+            url = f"{scheme}://{self.domain}/robots.txt"
+            try:
+                response = self.scraper.session.get(url, timeout=10)
+            except requests.RequestException:
+                continue
+            if response.status_code != 200:
+                break
+            rp.parse(response.text.splitlines())
+            self._robots = rp
+
+            crawl_delay = rp.crawl_delay(DEFAULT_HEADERS['User-Agent'])
+            if crawl_delay:
+                self.effective_delay = max(self.request_delay, float(crawl_delay))
+                logger.info(f"[{self.name}] Honoring robots.txt Crawl-delay: {self.effective_delay}s")
+            break
+
     def run(self):
         """Main worker loop - runs forever until stopped."""
-        print(f"[{self.name}] Started with {len(self.urls)} URL(s)")
-        
+        logger.info(f"[{self.name}] Started with {len(self.urls)} URL(s)")
+
+        self._load_robots()
+
         cycle = 0
-        while self.running:
+        while not self._stop_event.is_set():
             cycle += 1
-            print(f"\n[{self.name}] Starting cycle {cycle}")
-            
+            logger.info(f"\n[{self.name}] Starting cycle {cycle}")
+
             try:
                 self._process_urls()
             except Exception as e:
-                print(f"[{self.name}] Error in cycle {cycle}: {e}")
-            
-            if self.running:
-                print(f"[{self.name}] Cycle {cycle} complete. Sleeping {self.cycle_delay}s...")
-                # Sleep in small chunks to allow quick shutdown
-                for _ in range(self.cycle_delay):
-                    if not self.running:
-                        break
-                    time.sleep(1)
-        
-        print(f"[{self.name}] Stopped")
-    
+                logger.error(f"[{self.name}] Error in cycle {cycle}: {e}")
+
+            if self.history:
+                self.history.checkpoint()
+
+            if self._stop_event.is_set():
+                break
+
+            logger.info(f"[{self.name}] Cycle {cycle} complete. Sleeping {self.cycle_delay}s...")
+            # Blocks for the whole cycle delay but wakes immediately
+            # on stop()
+            if self._stop_event.wait(timeout=self.cycle_delay):
+                break
+
+        logger.info(f"[{self.name}] Stopped")
+
     def _process_urls(self):
         """Process all URLs for this domain."""
+        # URLs handled this cycle; catches repeats (e.g. two sitemap
+        # entries for one article) even when history is disabled.
+        self._seen_this_cycle = set()
+
         for url in self.urls:
-            if not self.running:
+            if self._stop_event.is_set():
                 break
-            
+
             # Skip if already scraped
             if self.history and self.history.is_scraped(url):
-                print(f"[{self.name}] Skip (already scraped): {url}")
+                logger.info(f"[{self.name}] Skip (already scraped): {url}")
+                continue
+
+            if self._robots and not self._robots.can_fetch(DEFAULT_HEADERS['User-Agent'], url):
+                logger.info(f"[{self.name}] Skip (disallowed by robots.txt): {url}")
                 continue
             
             # Check logic:
@@ -92,23 +138,24 @@ class DomainWorker(threading.Thread):
                 self._process_sitemap(url)
             else:
                 self._process_single_url(url)
-            
-            time.sleep(self.request_delay)
+
+            if self._stop_event.wait(timeout=self.effective_delay):
+                break
     
     def _process_sitemap(self, url: str):
         """Process a root domain via sitemap discovery."""
-        print(f"[{self.name}] Discovering sitemap for {url}")
+        logger.info(f"[{self.name}] Discovering sitemap for {url}")
         sitemap_url = discover_sitemap(url)
         
         if not sitemap_url:
-            print(f"[{self.name}] No sitemap found for {url}")
+            logger.info(f"[{self.name}] No sitemap found for {url}")
             return
         
         self._scrape_and_save_sitemap(sitemap_url)
 
     def _process_sitemap_url(self, sitemap_url: str):
         """Process a direct sitemap URL."""
-        print(f"[{self.name}] Processing direct sitemap: {sitemap_url}")
+        logger.info(f"[{self.name}] Processing direct sitemap: {sitemap_url}")
         self._scrape_and_save_sitemap(sitemap_url)
 
     def _scrape_and_save_sitemap(self, sitemap_url: str):
@@ -116,24 +163,30 @@ class DomainWorker(threading.Thread):
         articles = self.scraper.scrape_from_sitemap(
             sitemap_url=sitemap_url,
             max_articles=self.max_articles,
-            delay=self.request_delay
+            delay=self.effective_delay
         )
         
         for article in articles:
-            if not self.running:
+            if self._stop_event.is_set():
                 break
+            if article.url in self._seen_this_cycle:
+                continue
             if self.history and self.history.is_scraped(article.url):
                 continue
-            
+
             self.storage.save(article, output_format=self.output_format)
+            self._seen_this_cycle.add(article.url)
             if self.history:
                 self.history.mark_scraped(article.url)
-    
+
     def _process_single_url(self, url: str):
         """Process a single article URL."""
+        if url in self._seen_this_cycle:
+            return
         article = self.scraper.scrape(url, validate_url=False)
         if article:
             self.storage.save(article, output_format=self.output_format)
+            self._seen_this_cycle.add(url)
             if self.history:
                 self.history.mark_scraped(url)
 
@@ -145,15 +198,18 @@ class WorkerManager:
         self.config = config
         self.output_dir = output_dir
         self.workers: List[DomainWorker] = []
-        self.running = False
-        
+        self._storage: Optional[ArticleStorage] = None
+        # One event wakes the manager immediately on shutdown instead
+        # of the main thread polling a flag every second.
+        self._stop_event = threading.Event()
+
         # Setup signal handler for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
-        print("\n[Manager] Shutdown signal received. Stopping workers...")
+        logger.info("\n[Manager] Shutdown signal received. Stopping workers...")
         self.stop()
     
     def _group_urls_by_domain(self) -> Dict[str, List[str]]:
@@ -174,16 +230,20 @@ class WorkerManager:
         """Start all domain workers."""
         domain_urls = self._group_urls_by_domain()
         
-        print(f"[Manager] Starting {len(domain_urls)} worker(s)")
+        logger.info(f"[Manager] Starting {len(domain_urls)} worker(s)")
         
-        # Create shared resources
+        # Create shared resources. The scraper and storage hold no
+        # per-domain state, so one instance serves every worker; the
+        # shared connection pool is sized so each domain can keep a
+        # warm connection.
         history = HistoryManager() if self.config.prevent_duplicates else None
-        
+        configure_pool(pool_connections=max(32, len(domain_urls)),
+                       pool_maxsize=max(32, len(domain_urls) * 4))
+        scraper = Scraper()
+        storage = ArticleStorage(self.output_dir, airtable_config=self.config.airtable)
+        self._storage = storage
+
         for domain, urls in domain_urls.items():
-            # Each worker gets its own scraper instance
-            scraper = Scraper()
-            storage = ArticleStorage(self.output_dir, airtable_config=self.config.airtable)
-            
             worker = DomainWorker(
                 domain=domain,
                 urls=urls,
@@ -199,24 +259,29 @@ class WorkerManager:
             self.workers.append(worker)
             worker.start()
         
-        self.running = True
-        
-        # Keep main thread alive
+        # Keep main thread alive until shutdown is signalled or every
+        # worker has died on its own
         try:
-            while self.running and any(w.is_alive() for w in self.workers):
-                time.sleep(1)
+            while any(w.is_alive() for w in self.workers):
+                if self._stop_event.wait(timeout=5):
+                    break
         except KeyboardInterrupt:
             self.stop()
     
     def stop(self):
         """Stop all workers gracefully."""
-        self.running = False
-        
+        self._stop_event.set()
+
         for worker in self.workers:
             worker.stop()
         
         # Wait for workers to finish
         for worker in self.workers:
             worker.join(timeout=5)
-        
-        print("[Manager] All workers stopped")
+
+        # Drain queued uploads and the Airtable batch buffer so a
+        # partial batch isn't lost on shutdown
+        if self._storage is not None:
+            self._storage.flush()
+
+        logger.info("[Manager] All workers stopped")